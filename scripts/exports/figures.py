@@ -1,6 +1,8 @@
 """Plot all code-generated figures in Amaral et al., 2022."""
 import pickle
 
+import matplotlib
+matplotlib.use('Agg')  # figures are only written to disk
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.lines import Line2D
@@ -152,7 +154,7 @@ for ax in (host1, host2):
         ax.axhline(d, c=black, ls=':', zorder=1)
 
 fig.savefig('../../results/exports/figures/Figure1.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 3, theoretical dvm
@@ -188,7 +190,7 @@ ax.axhline(zm, lw=0.5, ls='--', c=black)
 ax.axhline((zm + zg) / 2, lw=0.5, ls='--', c=black)
 
 fig.savefig('../../results/exports/figures/Figure3.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 4, POC data
@@ -226,7 +228,7 @@ for ax in (ax1, ax2):
 ax2.tick_params(labelleft=False)
 
 fig.savefig('../../results/exports/figures/Figure4.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 5, POC estimates
@@ -282,7 +284,7 @@ ax.legend(fontsize=12, borderpad=0.2, handletextpad=0.4,
           loc='lower right')
 
 fig.savefig('../../results/exports/figures/Figure5.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 6, non-uniform params
@@ -309,7 +311,7 @@ for inversion, inv_result in results_dict.items():
 
     if inversion == 'NA':
         axs = na_axs
-        [ax.axes.xaxis.set_ticklabels([]) for ax in axs]
+        plt.setp(axs, xticklabels=[])
     else:
         axs = sp_axs
     results = inv_result['params']
@@ -335,38 +337,27 @@ for inversion, inv_result in results_dict.items():
         ax.set_xlim(xlims[p])
         ax.set_ylim(top=0, bottom=530)
         ax.tick_params(axis='both', which='major', labelsize=12)
-        ax.axvline(results[p]['prior'], c=blue, lw=1.5, ls=':')
-        ax.axvline(results[p]['prior'] - results[p]['prior_e'], c=blue, lw=1.5,
-                   ls='--')
-        ax.axvline(results[p]['prior'] + results[p]['prior_e'], c=blue, lw=1.5,
-                   ls='--')
-
-        for j, _ in enumerate(GRID):
-
-            if j == 0:
-                depths = 0, GRID[j]
-            else:
-                depths = GRID[j - 1], GRID[j]
-
-            if 'w' in p:
-                ax.errorbar(results[p]['posterior'][j], depths[1], fmt='o',
-                            xerr=results[p]['posterior_e'][j], ms=8,
-                            ecolor=orange, elinewidth=1, c=orange,
-                            capsize=6, fillstyle='none', zorder=3,
-                            markeredgewidth=1)
-            else:
-                depth = np.mean(depths)
-                ax.scatter(results[p]['posterior'][j], depth, marker='o',
-                           c=orange, s=14, zorder=3)
-                ax.fill_betweenx(depths,
-                                 (results[p]['posterior'][j] -
-                                  results[p]['posterior_e'][j]),
-                                 (results[p]['posterior'][j]
-                                  + results[p]['posterior_e'][j]),
-                                 color=orange, alpha=0.25)
+        prior = results[p]['prior']
+        prior_e = results[p]['prior_e']
+        ax.vlines([prior, prior - prior_e, prior + prior_e], 0, 530,
+                  colors=blue, linestyles=[':', '--', '--'], lw=1.5)
+
+        posterior = np.asarray(results[p]['posterior'])
+        posterior_e = np.asarray(results[p]['posterior_e'])
+        if 'w' in p:
+            ax.errorbar(posterior, GRID, fmt='o', xerr=posterior_e, ms=8,
+                        ecolor=orange, elinewidth=1, c=orange, capsize=6,
+                        fillstyle='none', zorder=3, markeredgewidth=1)
+        else:
+            ax.scatter(posterior, MID_DEPTHS, marker='o', c=orange, s=14,
+                       zorder=3)
+            ax.fill_betweenx(np.ravel(LAYER_BOUNDS),
+                             np.repeat(posterior - posterior_e, 2),
+                             np.repeat(posterior + posterior_e, 2),
+                             color=orange, alpha=0.25)
 
 fig.savefig('../../results/exports/figures/Figure6.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 7, uniform params
@@ -402,13 +393,14 @@ for i, p in enumerate(dc_params):
 
 handles, labels = ax5.get_legend_handles_labels()
 handles = [h[0] for h in handles]
-unique = [(h, l) for i, (h, l) in enumerate(
-    zip(handles, labels)) if l not in labels[:i]]
-ax6.legend(*zip(*unique), fontsize=12, loc='center', frameon=False,
-           ncol=1, labelspacing=2, bbox_to_anchor=(0.35, 0.5))
+unique = {}
+for h, l in zip(handles, labels):
+    unique.setdefault(l, h)
+ax6.legend(unique.values(), unique.keys(), fontsize=12, loc='center',
+           frameon=False, ncol=1, labelspacing=2, bbox_to_anchor=(0.35, 0.5))
 
 fig.savefig('../../results/exports/figures/Figure7.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 8, residual profiles
@@ -424,7 +416,7 @@ for inversion, inv_result in results_dict.items():
 
     if inversion == 'NA':
         axs = na_axs
-        [ax.axes.xaxis.set_ticklabels([]) for ax in axs]
+        plt.setp(axs, xticklabels=[])
     else:
         axs = sp_axs
         axs[0].set_xlabel(
@@ -449,19 +441,12 @@ for inversion, inv_result in results_dict.items():
                           labelpad=20)
             ax.yaxis.set_label_position('right')
 
-        for j in range(len(GRID)):
-
-            if j == 0:
-                depths = 0, GRID[j]
-            else:
-                depths = GRID[j - 1], GRID[j]
-
-            ax.scatter(results[t][j][0], np.mean(depths), marker='o',
-                       c=orange, s=100, zorder=3, lw=0.7)
-            ax.fill_betweenx(depths,
-                             (results[t][j][0] - results[t][j][1]),
-                             (results[t][j][0] + results[t][j][1]),
-                             color=orange, alpha=0.25)
+        ests = np.array([results[t][j][0] for j in LAYERS])
+        errs = np.array([results[t][j][1] for j in LAYERS])
+        ax.scatter(ests, MID_DEPTHS, marker='o', c=orange, s=100, zorder=3,
+                   lw=0.7)
+        ax.fill_betweenx(np.ravel(LAYER_BOUNDS), np.repeat(ests - errs, 2),
+                         np.repeat(ests + errs, 2), color=orange, alpha=0.25)
         prior_err = 0.5 * Po_prior * 30
         ax.axvline(prior_err, ls='--', c=blue)
         ax.axvline(-prior_err, ls='--', c=blue)
@@ -469,12 +454,14 @@ for inversion, inv_result in results_dict.items():
         axs[1].tick_params(labelleft=False)
 
 fig.savefig('../../results/exports/figures/Figure8.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 9, param comparisons
 ######################################################
 
+brig_z = np.arange(250, 555, 50)
+
 data1 = {'MNA': {'B2': (2 / DPY, 0.2 / DPY), 'Bm2': (156 / DPY, 17 / DPY),
                  'Bm1s': (13 / DPY, 1 / DPY)},
          'MNWA': {0: {'depth': 25.5,
@@ -502,9 +489,12 @@ data1 = {'MNA': {'B2': (2 / DPY, 0.2 / DPY), 'Bm2': (156 / DPY, 17 / DPY),
                       'Bm1s': (113 / DPY, 10000 / DPY),
                       'B2': (17 / DPY, 77 / DPY),
                       'Bm2': (870 / DPY, 5000 / DPY)}},
-         'BRIG': {'depth': np.arange(250, 555, 50),
-                  'Bm2': (0.27 * np.exp(-0.0024 * np.arange(250, 555, 50)),
-                          0.03 * np.exp(-0.00027 * np.arange(250, 555, 50)))}}
+         'BRIG': {'depth': brig_z,
+                  'Bm2': (0.27 * np.exp(-0.0024 * brig_z),
+                          0.03 * np.exp(-0.00027 * brig_z))}}
+
+mnwa_depths = [d['depth'] for d in data1['MNWA'].values()]
+mnwa_d_errs = [d['THICK'] / 2 for d in data1['MNWA'].values()]
 
 data2 = {'B2': {'EP': all_data['C91_agg_EP'], 'SP': all_data['C91_agg_SP']},
          'Bm1s': {'EP': all_data['C91_remin_EP'],
@@ -521,7 +511,7 @@ for inversion, inv_result in results_dict.items():
 
     if inversion == 'NA':
         axs = na_axs
-        [ax.axes.xaxis.set_ticklabels([]) for ax in axs]
+        plt.setp(axs, xticklabels=[])
     else:
         axs = sp_axs
     results = inv_result['params']
@@ -548,28 +538,17 @@ for inversion, inv_result in results_dict.items():
         ax.set_xscale('log')
         ax.set_ylim([600, -50])
 
-        for j in range(len(GRID)):
-
-            if j == 0:
-                depths = 0, GRID[j]
-            else:
-                depths = GRID[j - 1], GRID[j]
-
-            d_av = np.mean(depths)
-            d_err = THICK[j] / 2
-
-            ax.errorbar(results[p]['posterior'][j], d_av, fmt='o', yerr=d_err,
-                        c=vermillion, capsize=capsize, zorder=9)
-            ax.scatter(results[p]['posterior_e'][j], d_av, marker='o',
-                       facecolors='none', edgecolors=black, zorder=10)
+        ax.errorbar(results[p]['posterior'], MID_DEPTHS, fmt='o',
+                    yerr=np.asarray(THICK) / 2, c=vermillion,
+                    capsize=capsize, zorder=9)
+        ax.scatter(results[p]['posterior_e'], MID_DEPTHS, marker='o',
+                   facecolors='none', edgecolors=black, zorder=10)
 
-        for z in data1['MNWA']:
-            d_av = data1['MNWA'][z]['depth']
-            d_err = data1['MNWA'][z]['THICK'] / 2
-            ax.errorbar(data1['MNWA'][z][p][0], d_av, fmt='s', yerr=d_err,
-                        c=radish, capsize=4)
-            ax.scatter(data1['MNWA'][z][p][1], d_av, marker='s',
-                       facecolors='none', edgecolors=black, zorder=10)
+        mnwa = data1['MNWA'].values()
+        ax.errorbar([d[p][0] for d in mnwa], mnwa_depths, fmt='s',
+                    yerr=mnwa_d_errs, c=radish, capsize=4)
+        ax.scatter([d[p][1] for d in mnwa], mnwa_depths, marker='s',
+                   facecolors='none', edgecolors=black, zorder=10)
 
         ax.errorbar(data1['MNA'][p][0], 225, fmt='d', yerr=75, c=green,
                     capsize=capsize, zorder=4)
@@ -582,26 +561,20 @@ for inversion, inv_result in results_dict.items():
             ax.scatter(data1['BRIG'][p][1], data1['BRIG']['depth'], marker='*',
                        zorder=10, edgecolors=black, facecolors='none', s=60)
 
-        for s in data2[p]:
-            if s == 'EP':
-                m = '^'
-                c = sky
-            else:
-                m = 'v'
-                c = blue
-            ax.scatter(data2[p][s]['mean'], data2[p][s]['depth'], marker=m,
-                       c=c)
-            if 'error' in data2[p][s].columns:
-                ax.scatter(data2[p][s]['error'], data2[p][s]['depth'],
-                           marker=m, zorder=10, edgecolors=black,
-                           facecolors='none')
-
-    axs[0].set_xlim([0.001, 100000])
-    axs[0].set_xticks([0.001, 0.1, 10, 1000, 10**5])
-    axs[1].set_xlim([0.01, 100])
-    axs[1].set_xticks([0.01, 0.1, 1, 10, 100])
-    axs[2].set_xlim([0.00001, 1])
-    axs[2].set_xticks([0.00001, 0.0001, 0.001, 0.01, 0.1, 1])
+        for s, m, c in (('EP', '^', sky), ('SP', 'v', blue)):
+            if s not in data2[p]:
+                continue
+            cleg = data2[p][s]
+            ax.scatter(cleg['mean'], cleg['depth'], marker=m, c=c)
+            if 'error' in cleg.columns:
+                ax.scatter(cleg['error'], cleg['depth'], marker=m, zorder=10,
+                           edgecolors=black, facecolors='none')
+
+    scales = (((0.001, 100000), (0.001, 0.1, 10, 1000, 10**5)),
+              ((0.01, 100), (0.01, 0.1, 1, 10, 100)),
+              ((0.00001, 1), (0.00001, 0.0001, 0.001, 0.01, 0.1, 1)))
+    for ax, (lim, ticks) in zip(axs, scales):
+        ax.set(xlim=lim, xticks=ticks)
     axs[2].yaxis.set_label_position('right')
 
 leg_elements = [Line2D([0], [0], marker='o', mec=black, c=white,
@@ -628,7 +601,7 @@ na_axs[1].legend(handles=leg_elements, fontsize=10, ncol=3,
                  handletextpad=0.01, frameon=False)
 
 fig.savefig('../../results/exports/figures/Figure9.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 10, sinking fluxes
@@ -654,7 +627,7 @@ fig.text(0.54, 0.03, 'POC flux (mmol m$^{-2}$ d$^{-1}$)', fontsize=14,
 for inversion, inv_result in results_dict.items():
     if inversion == 'NA':
         axs = na_axs
-        [ax.axes.xaxis.set_ticklabels([]) for ax in axs]
+        plt.setp(axs, xticklabels=[])
     else:
         axs = sp_axs
     ylabel = f'{inversion} inversion'
@@ -712,7 +685,7 @@ for inversion, inv_result in results_dict.items():
                       handletextpad=0.01)
 
 fig.savefig('../../results/exports/figures/Figure10.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 11, volumetric fluxes
@@ -765,71 +738,54 @@ for inversion, inv_result in results_dict.items():
         if pr[0] != 'production':
 
             result = inv_result['int_fluxes']
-
-            for j in range(len(GRID)):
-
-                if j == 0:
-                    depths = 0, GRID[j]
-                else:
-                    depths = GRID[j - 1], GRID[j]
-
-                ax.scatter(
-                    result[pr[0]][j][0] / THICK[j], np.mean(depths),
-                    marker='o', c=blue, s=14, zorder=3, lw=0.7,
-                    label=flux_text[pr[0]])
-                ax.fill_betweenx(
-                    depths,
-                    (result[pr[0]][j][0] - result[pr[0]][j][1]) / THICK[j],
-                    (result[pr[0]][j][0] + result[pr[0]][j][1]) / THICK[j],
-                    color=blue, alpha=0.25)
-                ax.scatter(
-                    result[pr[1]][j][0] / THICK[j], np.mean(depths),
-                    marker='o', c=orange, s=14, zorder=3, lw=0.7,
-                    label=flux_text[pr[1]])
-                ax.fill_betweenx(
-                    depths,
-                    (result[pr[1]][j][0] - result[pr[1]][j][1]) / THICK[j],
-                    (result[pr[1]][j][0] + result[pr[1]][j][1]) / THICK[j],
-                    color=orange, alpha=0.25)
+            bounds = np.ravel(LAYER_BOUNDS)
+
+            for flx, color in ((pr[0], blue), (pr[1], orange)):
+                ests = np.array([result[flx][j][0] for j in LAYERS]) / THICK
+                errs = np.array([result[flx][j][1] for j in LAYERS]) / THICK
+                ax.scatter(ests, MID_DEPTHS, marker='o', c=color, s=14,
+                           zorder=3, lw=0.7, label=flux_text[flx])
+                ax.fill_betweenx(bounds, np.repeat(ests - errs, 2),
+                                 np.repeat(ests + errs, 2), color=color,
+                                 alpha=0.25)
             if i == 0:
                 ax.axvline(0, ls=':', c=black, zorder=1)
 
         else:
             result = inv_result['production_profile']
-            depths = GRID
+            ests = np.array([x[0] for x in result])
+            errs = np.array([x[1] for x in result])
             df = all_data['NPP']
             H = 30
-            npp = df.loc[df['target_depth'] >= H]['NPP']
-            depth = df.loc[df['target_depth'] >= H]['target_depth']
+            below_mld = df.loc[df['target_depth'] >= H]
             ax.scatter(
-                npp / MMC,
-                depth,
+                below_mld['NPP'] / MMC,
+                below_mld['target_depth'],
                 c=orange,
                 alpha=0.5,
                 label='NPP',
                 s=10)
             ax.scatter(
-                [x[0] for x in result], depths, marker='o', c=blue, s=14,
+                ests, GRID, marker='o', c=blue, s=14,
                 label=flux_text[pr[0]], zorder=3, lw=0.7)
             ax.errorbar(
-                [x[0] for x in result], GRID, fmt='o',
-                xerr=[x[1] for x in result], ecolor=blue, elinewidth=0.5,
+                ests, GRID, fmt='o', xerr=errs, ecolor=blue, elinewidth=0.5,
                 c=blue, ms=1.5, capsize=2, fillstyle='full',
                 markeredgewidth=0.5)
 
         if ylabel == 'NA inversion':
             handles, labels = ax.get_legend_handles_labels()
-            unique = [
-                (h, l) for i, (h, l) in enumerate(
-                    zip(handles, labels)) if l not in labels[:i]]
-            ax.legend(*zip(*unique), loc='center', fontsize=12,
-                      handletextpad=0.01, bbox_to_anchor=(0.45, 1.2),
-                      frameon=False)
+            unique = {}
+            for h, l in zip(handles, labels):
+                unique.setdefault(l, h)
+            ax.legend(unique.values(), unique.keys(), loc='center',
+                      fontsize=12, handletextpad=0.01,
+                      bbox_to_anchor=(0.45, 1.2), frameon=False)
         else:
             ax.set_xlabel(('A', 'B', 'C', 'D')[i], fontsize=14)
 
 fig.savefig('../../results/exports/figures/Figure11.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURE 12, DVM comparisons
@@ -888,36 +844,21 @@ for inversion, inv_result in results_dict.items():
         par.axis['top'].label.set_fontsize(12)
         par.axis['top'].major_ticklabels.set_size(12)
 
-    for j, _ in enumerate(GRID):
-        if j < 3:
-            host = hostL
-            par = parL
-            par_flux = 'remin_S'
-        else:
-            host = hostR
-            par = parR
-            par_flux = 'sinkdiv_L'
-        if j == 0:
-            depths = 0, GRID[j]
-        else:
-            depths = GRID[j - 1], GRID[j]
-
-        host.scatter(
-            result['dvm'][j][0] / THICK[j], np.mean(depths),
-            marker='o', c=blue, s=14, zorder=3, lw=0.7)
-        host.fill_betweenx(
-            depths,
-            (result['dvm'][j][0] - result['dvm'][j][1]) / THICK[j],
-            (result['dvm'][j][0] + result['dvm'][j][1]) / THICK[j],
-            color=blue, alpha=0.25)
-        par.scatter(
-            result[par_flux][j][0] / THICK[j], np.mean(depths),
-            marker='o', c=orange, s=14, zorder=3, lw=0.7)
-        par.fill_betweenx(
-            depths,
-            (result[par_flux][j][0] - result[par_flux][j][1]) / THICK[j],
-            (result[par_flux][j][0] + result[par_flux][j][1]) / THICK[j],
-            color=orange, alpha=0.25)
+    mid_depths = np.asarray(MID_DEPTHS)
+    for sl, host, par, par_flux in (
+            (slice(0, UMZ_START), hostL, parL, 'remin_S'),
+            (slice(UMZ_START, None), hostR, parR, 'sinkdiv_L')):
+        bounds = np.ravel(LAYER_BOUNDS[sl])
+        for flx, axis, color in (('dvm', host, blue), (par_flux, par, orange)):
+            ests = np.array([result[flx][j][0] for j in LAYERS[sl]])
+            errs = np.array([result[flx][j][1] for j in LAYERS[sl]])
+            ests = ests / THICK[sl]
+            errs = errs / THICK[sl]
+            axis.scatter(ests, mid_depths[sl], marker='o', c=color, s=14,
+                         zorder=3, lw=0.7)
+            axis.fill_betweenx(bounds, np.repeat(ests - errs, 2),
+                               np.repeat(ests + errs, 2), color=color,
+                               alpha=0.25)
     for ax in (hostL, hostR):
         ax.set_yticks([0, 100, 200, 300, 400, 500])
         ax.invert_yaxis()
@@ -925,7 +866,7 @@ for inversion, inv_result in results_dict.items():
         ax.axhline(100, ls=':', c=black)
 
 fig.savefig('../../results/exports/figures/Figure12.pdf')
-plt.close()
+plt.close(fig)
 
 ######################################################
 # FIGURES 13 & 14, budgets
@@ -943,13 +884,12 @@ for z, fig_label in (('EZ', 13), ('UMZ', 14)):
 
         if inversion == 'NA':
             axs = na_axs
-            [ax.axes.xaxis.set_visible(False) for ax in axs]
+            plt.setp([ax.xaxis for ax in axs], visible=False)
         else:
             axs = sp_axs
         ylabel = f'{inversion} inversion'
 
-        int_fluxes = inv_result['int_fluxes']
-        residuals = inv_result['residuals']
+        rfi = {**inv_result['int_fluxes'], **inv_result['residuals']}
 
         ax1, ax2 = axs
         ax2.set_ylabel(ylabel, fontsize=14, rotation=270, labelpad=20)
@@ -960,60 +900,46 @@ for z, fig_label in (('EZ', 13), ('UMZ', 14)):
             ax.axhline(0, c=black, lw=1)
             ax.set_ylim([-16, 15])
             ax.set_xlabel(f'$P_{sf}$ fluxes', fontsize=14)
-            labels = ['SFD', 'Remin.', 'Agg.', 'Disagg.', 'Resid.']
-            fluxes = [-int_fluxes[f'sinkdiv_{sf}'][z][0],
-                      -int_fluxes[f'remin_{sf}'][z][0],
-                      agg_sign * int_fluxes['aggregation'][z][0],
-                      dagg_sign * int_fluxes['disaggregation'][z][0],
-                      residuals[f'POC{sf}'][z][0]]
-            flux_errs = [int_fluxes[f'sinkdiv_{sf}'][z][1],
-                         int_fluxes[f'remin_{sf}'][z][1],
-                         int_fluxes['aggregation'][z][1],
-                         int_fluxes['disaggregation'][z][1],
-                         residuals[f'POC{sf}'][z][1]]
-
+            spec = [('SFD', f'sinkdiv_{sf}', -1),
+                    ('Remin.', f'remin_{sf}', -1),
+                    ('Agg.', 'aggregation', agg_sign),
+                    ('Disagg.', 'disaggregation', dagg_sign)]
             if sf == 'S':
-                labels.insert(-1, 'Prod.')
-                fluxes.insert(-1, int_fluxes['production'][z][0])
-                flux_errs.insert(-1, int_fluxes['production'][z][1])
+                spec.append(('Prod.', 'production', 1))
+                if z == 'EZ':
+                    spec.append(('DVM', 'dvm', -1))
             else:
                 ax.tick_params(labelleft=False)
+                if z == 'UMZ':
+                    spec.append(('DVM', 'dvm', 1))
+            spec.append(('Resid.', f'POC{sf}', 1))
 
-            if sf == 'S' and z == 'EZ':
-                labels.insert(-1, 'DVM')
-                fluxes.insert(-1, -int_fluxes['dvm'][z][0])
-                flux_errs.insert(-1, int_fluxes['dvm'][z][1])
-            elif sf == 'L' and z == 'UMZ':
-                labels.insert(-1, 'DVM')
-                fluxes.insert(-1, int_fluxes['dvm'][z][0])
-                flux_errs.insert(-1, int_fluxes['dvm'][z][1])
+            labels = [label for (label, _, _) in spec]
+            fluxes = np.fromiter((sign * rfi[k][z][0] for (_, k, sign) in spec),
+                                 dtype=float, count=len(spec))
+            flux_errs = np.fromiter((rfi[k][z][1] for (_, k, _) in spec),
+                                    dtype=float, count=len(spec))
 
-            ax.bar(list(range(len(fluxes))), fluxes, yerr=flux_errs,
+            ax.bar(np.arange(len(spec)), fluxes, yerr=flux_errs,
                    tick_label=labels, color=blue)
-            for tick in ax.get_xticklabels():
-                tick.set_rotation(45)
+            ax.tick_params(axis='x', labelrotation=45)
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 ######################################################
 # FIGURES S1 & S2, state element residuals
 ######################################################
 
 state_elements = NA_results['state_elements']
-eq_resids = []
 
 
 def normalized_state_residual_plots(x_resids, fig_label):
 
-    eq_resids = []
-
-    j = 0
-    for x in state_elements:
-        if 'R' in x:
-            eq_resids.append(x_resids.pop(j))
-        else:
-            j += 1
+    is_resid = np.array(['R' in x for x in state_elements])
+    x_resids = np.asarray(x_resids)
+    eq_resids = x_resids[is_resid]
+    x_resids = x_resids[~is_resid]
 
     fig, (ax1, ax2) = plt.subplots(1, 2, tight_layout=True)
     ax1.set_ylabel('Probability density', fontsize=16)
@@ -1025,7 +951,7 @@ def normalized_state_residual_plots(x_resids, fig_label):
     ax2.hist(eq_resids, density=True, color=blue)
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 
 normalized_state_residual_plots(NA_results['x_resids'], 'S1')
@@ -1041,6 +967,15 @@ combos = ((0.5, 0.5), (0.5, 0.5), (0.5, 1), (1, 0.5), (1, 1))
 run_colors = {0: blue, 1: orange, 2: green, 3: vermillion, 4: radish}
 basepath = '../../results/exports'
 
+runs_by_inversion = {}
+gammas = [g for (g, re) in combos]
+for inversion in ('NA', 'SP'):
+    runs = []
+    for (g, re) in combos:
+        with open(f'{basepath}/{inversion}_{re}_{g}.pkl', 'rb') as pickled:
+            runs.append(pickle.load(pickled))
+    runs_by_inversion[inversion] = runs
+
 for z, fig_label in (('EZ', 'S3'), ('UMZ', 'S4')):
 
     fig, (na_axs, sp_axs) = plt.subplots(2, 2)
@@ -1050,80 +985,57 @@ for z, fig_label in (('EZ', 'S3'), ('UMZ', 'S4')):
     sp_axs[0].yaxis.set_label_coords(-0.2, 1)
 
     for inversion in ('NA', 'SP'):
-        runs = []
-        gammas = []
-        for (g, re) in combos:
-            with open(f'{basepath}/{inversion}_{re}_{g}.pkl', 'rb') as pickled:
-                inv_result = pickle.load(pickled)
-                runs.append(inv_result)
-                gammas.append(g)
+        runs = runs_by_inversion[inversion]
         if inversion == 'NA':
             axs = na_axs
-            [ax.axes.xaxis.set_visible(False) for ax in axs]
+            plt.setp([ax.xaxis for ax in axs], visible=False)
         else:
             axs = sp_axs
-            [ax.set_ylim([-20, 20]) for ax in axs]
+            plt.setp(axs, ylim=(-20, 20))
 
         ax1, ax2 = axs
         ylabel = f'{inversion} inversions'
         ax2.set_ylabel(ylabel, fontsize=14, rotation=270, labelpad=20)
         ax2.yaxis.set_label_position('right')
 
-        for i, run in enumerate(runs):
-            if i > 0:
-                rfi = {**run['int_fluxes'], **run['residuals']}
-            else:
-                rfi = run['prior_fluxes']
-            color = run_colors[i]
-            for group in ((ax1, 'S', -1, 1), (ax2, 'L', 1, -1)):
-                ax, sf, agg_sign, dagg_sign = group
-                ax.axhline(0, c=black, lw=0.5)
-                ax.set_xlabel(f'$P_{sf}$ fluxes', fontsize=14)
-                ax_labels = ['SFD', 'Remin.', 'Agg.', 'Disagg.', 'Resid.']
-                fluxes = [-rfi[f'sinkdiv_{sf}'][z][0],
-                          -rfi[f'remin_{sf}'][z][0],
-                          agg_sign * rfi['aggregation'][z][0],
-                          dagg_sign * rfi['disaggregation'][z][0]]
-                flux_errs = [rfi[f'sinkdiv_{sf}'][z][1],
-                             rfi[f'remin_{sf}'][z][1],
-                             rfi['aggregation'][z][1],
-                             rfi['disaggregation'][z][1]]
+        for group in ((ax1, 'S', -1, 1), (ax2, 'L', 1, -1)):
+            ax, sf, agg_sign, dagg_sign = group
+            ax.axhline(0, c=black, lw=0.5)
+            ax.set_xlabel(f'$P_{sf}$ fluxes', fontsize=14)
+            spec = [('SFD', f'sinkdiv_{sf}', -1),
+                    ('Remin.', f'remin_{sf}', -1),
+                    ('Agg.', 'aggregation', agg_sign),
+                    ('Disagg.', 'disaggregation', dagg_sign)]
+            if sf == 'S':
+                spec.append(('Prod.', 'production', 1))
+                if z == 'EZ':
+                    spec.append(('DVM', 'dvm', -1))
+            elif z == 'UMZ':
+                spec.append(('DVM', 'dvm', 1))
+
+            ax_labels = [label for (label, _, _) in spec] + ['Resid.']
+            x = np.arange(len(ax_labels))
+
+            for i, run in enumerate(runs):
+                if i > 0:
+                    rfi = {**run['int_fluxes'], **run['residuals']}
+                else:
+                    rfi = run['prior_fluxes']
+                fluxes = [sign * rfi[k][z][0] for (_, k, sign) in spec]
+                flux_errs = [rfi[k][z][1] for (_, k, _) in spec]
                 if i > 0:
                     fluxes.append(rfi[f'POC{sf}'][z][0])
                     flux_errs.append(rfi[f'POC{sf}'][z][1])
                 else:
                     fluxes.append(0)
                     flux_errs.append(gammas[i] * Po_prior * 30)
-                if sf == 'S':
-                    ax_labels.insert(-1, 'Prod.')
-                    fluxes.insert(-1, rfi['production'][z][0])
-                    flux_errs.insert(-1, rfi['production'][z][1])
-                    if z == 'EZ':
-                        ax_labels.insert(-1, 'DVM')
-                        fluxes.insert(-1, -rfi['dvm'][z][0])
-                        flux_errs.insert(-1, rfi['dvm'][z][1])
-                elif sf == 'L' and z == 'UMZ':
-                    ax_labels.insert(-1, 'DVM')
-                    fluxes.insert(-1, rfi['dvm'][z][0])
-                    flux_errs.insert(-1, rfi['dvm'][z][1])
-                x = np.arange(len(ax_labels))
-                if i == 0:
-                    positions = x - width * 2
-                elif i == 1:
-                    positions = x - width
-                elif i == 2:
-                    positions = x
-                elif i == 3:
-                    positions = x + width
-                else:
-                    positions = x + width * 2
-                ax.bar(positions, fluxes, width=width, yerr=flux_errs,
-                       tick_label=ax_labels, color=color,
+                ax.bar(x + (i - 2) * width, fluxes, width=width,
+                       yerr=flux_errs, color=run_colors[i],
                        error_kw={'elinewidth': 1})
-                ax.set_xticks(x)
-                ax.set_xticklabels(ax_labels)
-                for tick in ax.get_xticklabels():
-                    tick.set_rotation(45)
+
+            ax.set_xticks(x)
+            ax.set_xticklabels(ax_labels)
+            ax.tick_params(axis='x', labelrotation=45)
     leg_elements = [
         Line2D([0], [0], c=blue, marker='s', ls='none', ms=6,
                label='prior ($\\gamma = 0.5, RE = 0.5$)'),
@@ -1139,7 +1051,7 @@ for z, fig_label in (('EZ', 'S3'), ('UMZ', 'S4')):
                      handletextpad=-0.5, loc=(-0.04, 0.54), labelspacing=0)
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 ######################################################
 # FIGURES S5 & S6, twin experiment POC profiles
@@ -1190,7 +1102,7 @@ for inv, fig_label in ((NA_results, 'S5'), (SP_results, 'S6')):
               loc='lower right')
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 ######################################################
 # FIGURES S7 & S8, twin experiments non-uniform params
@@ -1226,36 +1138,27 @@ for inv, fig_label in ((NA_results, 'S7'), (SP_results, 'S8')):
         ax.axvline(results[p]['prior'] + results[p]['prior_e'],
                    c=blue, lw=1.5, ls='--')
 
-        for j, _ in enumerate(GRID):
-            if j == 0:
-                depths = 0, GRID[j]
-            else:
-                depths = GRID[j - 1], GRID[j]
-
-            if 'w' in p:
-                depth = depths[1]
-                ax.errorbar(results[p]['posterior'][j], depth, fmt='o',
-                            xerr=results[p]['posterior_e'][j], ms=8,
-                            ecolor=orange, elinewidth=1, c=orange,
-                            capsize=6, fillstyle='none', zorder=3,
-                            markeredgewidth=1)
-            else:
-                depth = np.mean(depths)
-                ax.scatter(results[p]['posterior'][j], depth, marker='o',
-                           c=orange, s=14, zorder=3)
-                ax.fill_betweenx(depths,
-                                 (results[p]['posterior'][j] -
-                                  results[p]['posterior_e'][j]),
-                                 (results[p]['posterior'][j]
-                                  + results[p]['posterior_e'][j]),
-                                 color=orange, alpha=0.25)
-            ax.scatter(inv['targets']['params'][p]['posterior'][j], depth,
-                       marker='x', s=90, c=green)
-            if p == 'Bm2' and fig_label == 'S8':
-                ax.set_xlim([-1, 3])
+        posterior = np.asarray(results[p]['posterior'])
+        posterior_e = np.asarray(results[p]['posterior_e'])
+        if 'w' in p:
+            depth = GRID
+            ax.errorbar(posterior, depth, fmt='o', xerr=posterior_e, ms=8,
+                        ecolor=orange, elinewidth=1, c=orange, capsize=6,
+                        fillstyle='none', zorder=3, markeredgewidth=1)
+        else:
+            depth = MID_DEPTHS
+            ax.scatter(posterior, depth, marker='o', c=orange, s=14, zorder=3)
+            ax.fill_betweenx(np.ravel(LAYER_BOUNDS),
+                             np.repeat(posterior - posterior_e, 2),
+                             np.repeat(posterior + posterior_e, 2),
+                             color=orange, alpha=0.25)
+        ax.scatter(inv['targets']['params'][p]['posterior'], depth,
+                   marker='x', s=90, c=green)
+        if p == 'Bm2' and fig_label == 'S8':
+            ax.set_xlim([-1, 3])
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 ######################################################
 # FIGURES S9 & S10, twin experiments uniform params
@@ -1291,13 +1194,15 @@ for inv, fig_label in ((NA_results, 'S9'), (SP_results, 'S10')):
 
     handles, labels = ax5.get_legend_handles_labels()
     handles[-2:] = [h[0] for h in handles[-2:]]
-    unique = [(h, l) for i, (h, l) in enumerate(
-        zip(handles, labels)) if l not in labels[:i]]
-    ax6.legend(*zip(*unique), fontsize=12, loc='center', frameon=False,
-               ncol=1, labelspacing=2, bbox_to_anchor=(0.35, 0.5))
+    unique = {}
+    for h, l in zip(handles, labels):
+        unique.setdefault(l, h)
+    ax6.legend(unique.values(), unique.keys(), fontsize=12, loc='center',
+               frameon=False, ncol=1, labelspacing=2,
+               bbox_to_anchor=(0.35, 0.5))
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
 
 ######################################################
 # FIGURES S11 & S12, twin experiments residual profiles
@@ -1324,21 +1229,14 @@ for inv, fig_label in ((NA_results, 'S11'), (SP_results, 'S12')):
         ax.tick_params(axis='both', which='major', labelsize=12)
         ax.set_yticks([0, 100, 200, 300, 400, 500])
 
-        for j in range(len(GRID)):
-
-            if j == 0:
-                depths = 0, GRID[j]
-            else:
-                depths = GRID[j - 1], GRID[j]
-
-            ax.scatter(results[t][j][0], np.mean(depths), marker='o',
-                       c=orange, s=100, zorder=3, lw=0.7)
-            ax.fill_betweenx(depths,
-                             (results[t][j][0] - results[t][j][1]),
-                             (results[t][j][0] + results[t][j][1]),
-                             color=orange, alpha=0.25)
-            ax.scatter(inv['targets']['residuals'][t][j][0], np.mean(depths),
-                       marker='x', c=green, s=250)
+        ests = np.array([results[t][j][0] for j in LAYERS])
+        errs = np.array([results[t][j][1] for j in LAYERS])
+        targets = [inv['targets']['residuals'][t][j][0] for j in LAYERS]
+        ax.scatter(ests, MID_DEPTHS, marker='o', c=orange, s=100, zorder=3,
+                   lw=0.7)
+        ax.fill_betweenx(np.ravel(LAYER_BOUNDS), np.repeat(ests - errs, 2),
+                         np.repeat(ests + errs, 2), color=orange, alpha=0.25)
+        ax.scatter(targets, MID_DEPTHS, marker='x', c=green, s=250)
         prior_err = 0.5 * Po_prior * 30
 
         ax.axvline(prior_err, ls='--', c=blue)
@@ -1352,4 +1250,4 @@ for inv, fig_label in ((NA_results, 'S11'), (SP_results, 'S12')):
         ax2.tick_params(labelleft=False)
 
     fig.savefig(f'../../results/exports/figures/Figure{fig_label}.pdf')
-    plt.close()
+    plt.close(fig)
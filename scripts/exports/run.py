@@ -1,7 +1,7 @@
 """Invert EXPORTS POC concentration data."""
 from itertools import product
 from multiprocessing import Pool
-from pickle import dump
+from pickle import HIGHEST_PROTOCOL, dump
 from time import time
 
 import src.ati as ati
@@ -105,7 +105,7 @@ def run_model(priors_from, gamma, rel_err):
 
     save_path = f'../../results/exports/{priors_from}_{rel_err}_{gamma}.pkl'
     with open(save_path, 'wb') as file:
-        dump(to_pickle, file)
+        dump(to_pickle, file, protocol=HIGHEST_PROTOCOL)
 
 
 if __name__ == '__main__':
@@ -116,6 +116,8 @@ if __name__ == '__main__':
     gammas = (0.5, 1, 5, 10)
     rel_errs = (0.1, 0.2, 0.5, 1)
 
+    # each (site, gamma, rel_err) inversion is independent, so the sweep
+    # runs across all available cores
     with Pool() as p:
         p.starmap(run_model, product(study_sites, gammas, rel_errs))
 
@@ -1,5 +1,5 @@
 """Run twin experiments to validate the inverse model."""
-from pickle import dump
+from pickle import HIGHEST_PROTOCOL, dump
 from time import time
 
 import src.ati as ati
@@ -47,7 +47,7 @@ def run_twin_experiment(priors_from):
 
     save_path = f'../../results/exports/{priors_from}_{rel_err}_{gamma}_TE.pkl'
     with open(save_path, 'wb') as file:
-        dump(to_pickle, file)
+        dump(to_pickle, file, protocol=HIGHEST_PROTOCOL)
 
 
 if __name__ == '__main__':
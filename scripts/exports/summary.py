@@ -4,77 +4,78 @@ from itertools import product
 
 from src.exports.constants import LAYERS, ZONE_LAYERS
 
-
 priors_from = ('NA', 'SP')
 gammas = (0.5, 1, 5, 10)
 rel_errs = (0.1, 0.2, 0.5, 1)
 
-output_file = '../../results/exports/out.txt'
-with open(output_file, 'w') as f:
+out = []
+for (pf, g, re) in product(priors_from, gammas, rel_errs):
 
-    for (pf, g, re) in product(priors_from, gammas, rel_errs):
+    save_path = f'../../results/exports/{pf}_{re}_{g}.pkl'
+    with open(save_path, 'rb') as pickled:
+        results = pickle.load(pickled)
 
-        save_path = f'../../results/exports/{pf}_{re}_{g}.pkl'
-        with open(save_path, 'rb') as pickled:
-            results = pickle.load(pickled)
+    out.append('#################################\n')
+    out.append(f'GAMMA = {g}, RE = {re}, {pf}\n')
+    out.append('#################################\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Parameter Estimates\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for p in results['params']:
+        if p == 'B2':
+            continue
+        if results['params'][p]['dv']:
+            for l in LAYERS:
+                est = results['params'][p]['posterior'][l]
+                err = results['params'][p]['posterior_e'][l]
+                out.append('%s (%s): %.8f ± %.8f\n' % (p, l, est, err))
+        else:
+            est = results['params'][p]['posterior']
+            err = results['params'][p]['posterior_e']
+            out.append('%s: %.3f ± %.3f\n' % (p, est, err))
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Tracer Inventories\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for z in ZONE_LAYERS:
+        out.append(f'--------{z}--------\n')
+        for i in results['inventories']:
+            est, err = results['inventories'][i][z]
+            out.append('%s: %.2f ± %.2f\n' % (i, est, err))
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Integrated Fluxes\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for z in ZONE_LAYERS:
+        out.append(f'--------{z}--------\n')
+        for flx in results['int_fluxes']:
+            est, err = results['int_fluxes'][flx][z]
+            out.append('%s: %.2f ± %.2f\n' % (flx, est, err))
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Integrated Residuals\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for z in ZONE_LAYERS:
+        out.append(f'--------{z}--------\n')
+        for r in results['residuals']:
+            est, err = results['residuals'][r][z]
+            out.append('%s: %.2f ± %.2f\n' % (r, est, err))
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Residence Times\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for z in ZONE_LAYERS:
+        out.append(f'--------{z}--------\n')
+        for t in results['residence_times']:
+            est, err = results['residence_times'][t][z]
+            out.append('%s: %.1f ± %.1f\n' % (t, est, err))
+    out.append('+++++++++++++++++++++++++++\n')
+    out.append('Turnover Timescales\n')
+    out.append('+++++++++++++++++++++++++++\n')
+    for z in ZONE_LAYERS:
+        out.append(f'--------{z}--------\n')
+        for t in results['turnover_times']:
+            out.append(f'***{t}***\n')
+            for flx in results['turnover_times'][t][z]:
+                est, err = results['turnover_times'][t][z][flx]
+                out.append('%s: %.3f ± %.3f\n' % (flx, est, err))
 
-        print('#################################', file=f)
-        print(f'GAMMA = {g}, RE = {re}, {pf}', file=f)
-        print('#################################', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Parameter Estimates', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for p in results['params']:
-            if p == 'B2':
-                continue
-            if results['params'][p]['dv']:
-                for l in LAYERS:
-                    est = results['params'][p]['posterior'][l]
-                    err = results['params'][p]['posterior_e'][l]
-                    print(f'{p} ({l}): {est:.8f} ± {err:.8f}', file=f)
-            else:
-                est = results['params'][p]['posterior']
-                err = results['params'][p]['posterior_e']
-                print(f'{p}: {est:.3f} ± {err:.3f}', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Tracer Inventories', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for z in ZONE_LAYERS:
-            print(f'--------{z}--------', file=f)
-            for i in results['inventories']:
-                est, err = results['inventories'][i][z]
-                print(f'{i}: {est:.2f} ± {err:.2f}', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Integrated Fluxes', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for z in ZONE_LAYERS:
-            print(f'--------{z}--------', file=f)
-            for flx in results['int_fluxes']:
-                est, err = results['int_fluxes'][flx][z]
-                print(f'{flx}: {est:.2f} ± {err:.2f}', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Integrated Residuals', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for z in ZONE_LAYERS:
-            print(f'--------{z}--------', file=f)
-            for r in results['residuals']:
-                est, err = results['residuals'][r][z]
-                print(f'{r}: {est:.2f} ± {err:.2f}', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Residence Times', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for z in ZONE_LAYERS:
-            print(f'--------{z}--------', file=f)
-            for t in results['residence_times']:
-                est, err = results['residence_times'][t][z]
-                print(f'{t}: {est:.1f} ± {err:.1f}', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        print('Turnover Timescales', file=f)
-        print('+++++++++++++++++++++++++++', file=f)
-        for z in ZONE_LAYERS:
-            print(f'--------{z}--------', file=f)
-            for t in results['turnover_times']:
-                print(f'***{t}***', file=f)
-                for flx in results['turnover_times'][t][z]:
-                    est, err = results['turnover_times'][t][z][flx]
-                    print(f'{flx}: {est:.3f} ± {err:.3f}', file=f)
+output_file = '../../results/exports/out.txt'
+with open(output_file, 'w') as f:
+    f.write(''.join(out))
@@ -1,3 +1,4 @@
+import multiprocessing as mp
 import os
 import sys
 from itertools import product
@@ -6,6 +7,8 @@ from time import time
 import cartopy.crs
 import gsw
 import h5py
+import matplotlib
+matplotlib.use('Agg')  # figures are only written to disk
 import matplotlib.pyplot as plt
 import matplotlib.transforms as transforms
 import numpy as np
@@ -129,7 +132,7 @@ def param_section_compilation_dv():
             depth_str = 'depth'
         ax.scatter(mean['latitude'], mean[depth_str], c=to_plot, norm=norm, cmap=scheme, zorder=10)
     fig.savefig('../../results/geotraces/figs/FigureS2.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def param_section_compilation_dc():
@@ -191,7 +194,7 @@ def param_section_compilation_dc():
         ax.text(station_data[s]['latitude'], 1.02, s, ha='center', size=6, transform=transforms.blended_transform_factory(ax.transData, ax.transAxes))
 
     fig.savefig('../../results/geotraces/figs/Figure6.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def poc_section():
@@ -233,7 +236,7 @@ def poc_section():
             ax.scatter(poc_data[s]['latitude'], poc_data[s]['depth'], c=poc_data[s][tracer], norm=norm, cmap=scheme, zorder=10)
 
     fig.savefig('../../results/geotraces/figs/Figure2.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
     
 
 def get_station_color_legend(all_regimes=False):
@@ -296,7 +299,7 @@ def spaghetti_params():
     axs[0].legend(lines, labels, frameon=False, handlelength=line_length)
 
     fig.savefig('../../results/geotraces/figs/Figure7.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def spaghetti_ctd():
@@ -333,7 +336,7 @@ def spaghetti_ctd():
     axs[0].legend(lines, labels, frameon=False, handlelength=line_length)
 
     fig.savefig('../../results/geotraces/figs/Figure5.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def spaghetti_poc():
@@ -359,7 +362,7 @@ def spaghetti_poc():
     ax1.legend(lines, labels, frameon=False, handlelength=line_length)
 
     fig.savefig('../../results/geotraces/figs/FigureS1.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def ctd_files_by_station():
@@ -445,7 +448,7 @@ def ctd_plots_remin():
     o_axs[0].legend(lines, labels, frameon=False, handlelength=line_length)
     
     fig.savefig('../../results/geotraces/figs/FigureS4.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def ctd_plots_sink():
@@ -502,7 +505,7 @@ def ctd_plots_sink():
     axs[1].legend(lines, labels, frameon=False, handlelength=line_length)
     
     fig.savefig('../../results/geotraces/figs/FigureS3.pdf', bbox_inches='tight')
-    plt.close() 
+    plt.close(fig) 
 
 
 def get_param_text():
@@ -690,7 +693,7 @@ def flux_pigs_scatter():
         ax.set_ylim(0)
 
     fig.savefig(f'../../results/geotraces/figs/Figure9.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def agg_pigs_scatter():
@@ -823,7 +826,7 @@ def agg_pigs_scatter():
 
         
     fig.savefig(f'../../results/geotraces/figs/Figure10.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def phyto_size_index(d):
@@ -916,7 +919,7 @@ def multipanel_context():
     axs[6].set_ylim(0, 0.4)
 
     fig.savefig(f'../../results/geotraces/figs/Figure4.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def section_map():
@@ -934,7 +937,7 @@ def section_map():
         ax.annotate(s, (station_data[s]['longitude'], station_data[s]['latitude']), fontsize=6, xytext=(station_data[s]['longitude']+0.75, station_data[s]['latitude']))
         
     plt.savefig('../../results/geotraces/figs/Figure1.pdf', bbox_inches='tight')
-    plt.close()
+    plt.close(fig)
 
 
 def param_barplots():
@@ -1022,8 +1025,13 @@ def param_barplots():
     axs[1].legend(lines, labels, frameon=False, handlelength=line_length)
         
     fig.savefig('../../results/geotraces/figs/Figure8.pdf', bbox_inches='tight')
-    plt.close()
-            
+    plt.close(fig)
+
+
+def make_figure(figure_function):
+
+    figure_function()
+
 
 if __name__ == '__main__':
 
@@ -1038,18 +1046,17 @@ if __name__ == '__main__':
 
     output_fp = '../../results/geotraces/output.h5'
 
-    multipanel_context()
-    flux_pigs_scatter()
-    agg_pigs_scatter()
-    param_section_compilation_dc()
-    param_section_compilation_dv()
-    ctd_plots_remin()
-    ctd_plots_sink()
-    spaghetti_params()
-    spaghetti_ctd()
-    spaghetti_poc()
-    poc_section()
-    section_map()
-    param_barplots()
-    
+    figure_functions = (multipanel_context, flux_pigs_scatter,
+                        agg_pigs_scatter, param_section_compilation_dc,
+                        param_section_compilation_dv, ctd_plots_remin,
+                        ctd_plots_sink, spaghetti_params, spaghetti_ctd,
+                        spaghetti_poc, poc_section, section_map,
+                        param_barplots)
+
+    # the figures are independent, so draw them in parallel (workers
+    # inherit the station data loaded above)
+    with mp.Pool() as p:
+        p.map(make_figure, figure_functions)
+
+
     print(f'--- {(time() - start_time)/60} minutes ---')
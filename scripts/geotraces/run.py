@@ -150,7 +150,9 @@ if __name__ == '__main__':
         set_list.extend(itertools.repeat(s, len(stations)))
 
     inputs = zip(station_list, set_list)
-    with mp.Pool(64, maxtasksperchild=1) as p:
+    # recycle workers infrequently so that compiled model equations (cached
+    # per station configuration) are reused across param sets
+    with mp.Pool(64, maxtasksperchild=1000) as p:
         p.imap_unordered(invert_station, inputs)
         p.close()
         p.join()
@@ -1,14 +1,15 @@
 """Algorithm of total inversion (Tarantola and Valette, 1982)."""
 import numpy as np
 
-from src.modelequations import evaluate_model_equations
+from src.modelequations import compile_model_equations
 
 
-def calculate_xkp1(Co, xo, xk, f, F):
+def calculate_xkp1(Co_diag, xo, xk, f, F):
     """Calculate an estimate of the state vector.""
 
     Args:
-        Co (np.ndarray): Error covariance matrix of prior estimates.
+        Co_diag (np.ndarray): Diagonal of the error covariance matrix of
+        prior estimates.
         xo (np.ndarray): State vector of prior estimates.
         xk (np.ndarray): State vector of estimates at the beginning of an
         iteration, k.
@@ -18,14 +19,13 @@ def calculate_xkp1(Co, xo, xk, f, F):
     Returns:
         xkp1 (np.ndarray): State vector of new estimates produced after
         iteration k.
-        CoFT, FCoFTi (np.ndarray): Matrix products used in subsequent steps.
+        CoFT, FCoFT (np.ndarray): Matrix products used in subsequent steps.
     """
-    CoFT = Co @ F.T
+    CoFT = Co_diag[:, None] * F.T  # Co is diagonal, so Co @ F.T broadcasts
     FCoFT = F @ CoFT
-    FCoFTi = np.linalg.inv(FCoFT)
-    xkp1 = xo + CoFT @ FCoFTi @ (F @ (xk - xo) - f)
+    xkp1 = xo + CoFT @ np.linalg.solve(FCoFT, F @ (xk - xo) - f)
 
-    return xkp1, CoFT, FCoFTi
+    return xkp1, CoFT, FCoFT
 
 
 def check_convergence(xk, xkp1):
@@ -44,7 +44,8 @@ def check_convergence(xk, xkp1):
     """
     converged = False
     max_change_limit = 10**-6
-    change = np.abs((xkp1 - xk) / xk)
+    denom = np.maximum(np.abs(xk), 10**-30)  # guard against xk == 0
+    change = np.abs(xkp1 - xk) / denom
     max_change = np.max(change)
 
     if max_change < max_change_limit:
@@ -53,9 +54,14 @@ def check_convergence(xk, xkp1):
     return converged, max_change
 
 
-def calculate_cost(Co, xo, x):
-    """Evaluate the cost function given an estimate of the state vector, x"""
-    cost = (x - xo).T @ np.linalg.inv(Co) @ (x - xo)
+def calculate_cost(Co_inv_diag, xo, x):
+    """Evaluate the cost function given an estimate of the state vector, x.
+
+    Co is diagonal, so its inverse is the elementwise reciprocal of its
+    diagonal and the quadratic form reduces to a weighted sum of squares.
+    """
+    diff = x - xo
+    cost = diff @ (Co_inv_diag * diff)
 
     return cost
 
@@ -90,29 +96,37 @@ def find_solution(equation_elements, state_elements, xo, Co, grid, zg,
     max_iterations = 50
     convergence_evolution = []
     cost_evolution = []
-    xhat = np.full(xo.shape, -9999)
-    Ckp1 = np.full(Co.shape, -9999)
+    converged = False
+
+    Co_diag = np.diag(Co)
+    Co_inv_diag = 1 / Co_diag
+    f_func, F_func = compile_model_equations(
+        tuple(equation_elements), tuple(state_elements), tuple(grid), zg,
+        umz_start, mld, soft_constraint=soft_constraint)
 
     xk = xo
     xkp1 = np.ones(len(xk))  # at iteration k+1
     for count in range(max_iterations):
-        f, F = evaluate_model_equations(
-            equation_elements, xk, grid, zg, umz_start, mld,
-            state_elements=state_elements, soft_constraint=soft_constraint)
+        f = np.squeeze(f_func(*xk))
+        F = F_func(*xk)
 
-        xkp1, CoFT, FCoFTi = calculate_xkp1(Co, xo, xk, f, F)
-        cost = calculate_cost(Co, xo, xkp1)
+        xkp1, CoFT, FCoFT = calculate_xkp1(Co_diag, xo, xk, f, F)
+        cost = calculate_cost(Co_inv_diag, xo, xkp1)
 
         cost_evolution.append(cost)
         if count > 0:  # xk contains 0's for residuals when k=0
             converged, max_change = check_convergence(xk, xkp1)
             convergence_evolution.append(max_change)
             if converged:
-                Ckp1 = Co - CoFT @ FCoFTi @ F @ Co
+                Ckp1 = Co - CoFT @ np.linalg.solve(FCoFT, CoFT.T)
                 xhat = xkp1
                 break
         xk = xkp1
 
+    if not converged:  # only allocate sentinels for failed inversions
+        xhat = np.full(xo.shape, -9999)
+        Ckp1 = np.full(Co.shape, -9999)
+
     return xhat, Ckp1, convergence_evolution, cost_evolution, converged
 
 
@@ -1,10 +1,17 @@
 """Calculate budgets and inventories."""
+from functools import lru_cache
 from itertools import product
 
 import numpy as np
 import sympy as sym
 
 
+@lru_cache(maxsize=None)
+def get_symbol(name):
+    """Get a symbolic variable, caching to avoid repeated string parsing."""
+    return sym.symbols(name)
+
+
 def evaluate_symbolic_expression(y, state_elements, C, tracers=[],
                                  residuals=[], params=[]):
     """Evaluate a symbolic expression with its corresponding numerical values.
@@ -29,45 +36,74 @@ def evaluate_symbolic_expression(y, state_elements, C, tracers=[],
         error (float): Propagated error of the result.
     """
     x_symbolic = list(y.free_symbols)
-    x_numerical = []
-    x_indices = []
-
-    for x in x_symbolic:
-        x_indices.append(state_elements.index(x.name))
-        if '_' in x.name:  # if it varies with depth
-            element, layer = x.name.split('_')
-            layer = int(layer)
-            if element in tracers:
-                x_numerical.append(tracers[element]['posterior'][layer])
-            elif element[1:] in residuals:
-                x_numerical.append(residuals[element[1:]][layer][0])
-            else:  # if it's a depth-varying parameter
-                x_numerical.append(params[element]['posterior'][layer])
-        else:  # if it's a depth-independent parameter
-            x_numerical.append(params[x.name]['posterior'])
-
-    variance_sym = 0  # symbolic expression for variance of y
+    index_of = {e: i for i, e in enumerate(state_elements)}
+    x_indices = [index_of[x.name] for x in x_symbolic]
+    x_numerical = [get_numerical_value(x.name, tracers, residuals, params)
+                   for x in x_symbolic]
+
     derivs = [y.diff(x) for x in x_symbolic]
 
     # sub-CVM corresponding to state elements in y
     cvm = C[np.ix_(x_indices, x_indices)]
-    nrows, ncols = cvm.shape
-
-    for (i, j) in product(range(nrows), range(ncols)):
-        if i > j:
-            continue
-        if i == j:
-            variance_sym += (derivs[i]**2) * cvm[i, j]
-        else:
-            variance_sym += 2 * derivs[i] * derivs[j] * cvm[i, j]
-
-    result = sym.lambdify(x_symbolic, y, 'numpy')(*x_numerical)
-    variance = sym.lambdify(x_symbolic, variance_sym, 'numpy')(*x_numerical)
+
+    evaluated = sym.lambdify(x_symbolic, [y] + derivs, 'numpy')(*x_numerical)
+    result = evaluated[0]
+    gradient = np.array(evaluated[1:], dtype=float)
+    variance = gradient @ cvm @ gradient
     error = np.sqrt(variance)
 
     return result, error
 
 
+def evaluate_symbolic_expressions(ys, state_elements, C, tracers=[],
+                                  residuals=[], params=[]):
+    """Evaluate multiple symbolic expressions with one compiled function.
+
+    Equivalent to calling evaluate_symbolic_expression on each element of ys,
+    but the expressions are lambdified together (sharing common
+    subexpressions) and their gradients are applied to the covariance matrix
+    in a single pass.
+
+    Returns:
+        results (list[tuple]): Result and propagated error of each expression
+        in ys.
+    """
+    index_of = {e: i for i, e in enumerate(state_elements)}
+    x_symbolic = sorted(set().union(*(y.free_symbols for y in ys)),
+                        key=lambda x: index_of[x.name])
+    x_indices = [index_of[x.name] for x in x_symbolic]
+    x_numerical = [get_numerical_value(x.name, tracers, residuals, params)
+                   for x in x_symbolic]
+
+    ys_matrix = sym.Matrix(ys)
+    jacobian = ys_matrix.jacobian(x_symbolic)
+    evaluated = sym.lambdify(
+        x_symbolic, [ys_matrix, jacobian], 'numpy', cse=True)(*x_numerical)
+    results = np.asarray(evaluated[0], dtype=float).ravel()
+    gradients = np.asarray(evaluated[1], dtype=float)
+
+    # sub-CVM corresponding to state elements in ys
+    cvm = C[np.ix_(x_indices, x_indices)]
+    variances = ((gradients @ cvm) * gradients).sum(axis=1)
+    errors = np.sqrt(variances)
+
+    return list(zip(results, errors))
+
+
+def get_numerical_value(name, tracers, residuals, params):
+    """Get the numerical value of a state element by its name."""
+    if '_' in name:  # if it varies with depth
+        element, layer = name.split('_')
+        layer = int(layer)
+        if element in tracers:
+            return tracers[element]['posterior'][layer]
+        if element[1:] in residuals:
+            return residuals[element[1:]][layer][0]
+        return params[element]['posterior'][layer]  # depth-varying parameter
+
+    return params[name]['posterior']  # depth-independent parameter
+
+
 def get_symbolic_residuals(residuals, umz_start, layers):
     """Get symbolic residual expressions for model layers and zones.
 
@@ -84,9 +120,9 @@ def get_symbolic_residuals(residuals, umz_start, layers):
     resids_sym = {r: {} for r in residuals}
 
     for r in resids_sym:
-        profile = [sym.symbols(f'R{r}_{l}') for l in layers]
-        resids_sym[r]['EZ'] = np.sum(profile[:umz_start])
-        resids_sym[r]['UMZ'] = np.sum(profile[umz_start:])
+        profile = [get_symbol(f'R{r}_{l}') for l in layers]
+        resids_sym[r]['EZ'] = sym.Add(*profile[:umz_start])
+        resids_sym[r]['UMZ'] = sym.Add(*profile[umz_start:])
         for l in layers:
             resids_sym[r][l] = profile[l]
 
@@ -110,13 +146,13 @@ def get_symbolic_inventories(tracers, umz_start, layers, thick):
     inventories_sym = {t: {} for t in tracers}
 
     for t in tracers:
-        concentrations = [sym.symbols(f'{t}_{l}') for l in layers]
+        concentrations = [get_symbol(f'{t}_{l}') for l in layers]
         profile = [concentrations[0] * thick[0]]  # mixed layer
         for i, h in enumerate(thick[1:], 1):  # all other layers
             avg_conc = np.mean([concentrations[i], concentrations[i - 1]])
             profile.append(avg_conc * h)
-        inventories_sym[t]['EZ'] = np.sum(profile[:umz_start])
-        inventories_sym[t]['UMZ'] = np.sum(profile[umz_start:])
+        inventories_sym[t]['EZ'] = sym.Add(*profile[:umz_start])
+        inventories_sym[t]['UMZ'] = sym.Add(*profile[umz_start:])
         for l in layers:
             inventories_sym[t][l] = profile[l]
 
@@ -125,12 +161,14 @@ def get_symbolic_inventories(tracers, umz_start, layers, thick):
 
 def integrate_by_zone(symbolic, state_elements, C, **state_element_types):
     """Integrate symbolic expressions by model zone."""
-    integrated = {k: {} for k in symbolic}
+    keys = tuple(product(symbolic, ('EZ', 'UMZ')))
+    results = evaluate_symbolic_expressions(
+        [symbolic[k][z] for (k, z) in keys], state_elements, C,
+        **state_element_types)
 
-    for (k, z) in product(integrated, ('EZ', 'UMZ')):
-        y = symbolic[k][z]
-        integrated[k][z] = evaluate_symbolic_expression(
-            y, state_elements, C, **state_element_types)
+    integrated = {k: {} for k in symbolic}
+    for (k, z), result in zip(keys, results):
+        integrated[k][z] = result
 
     return integrated
 
@@ -141,9 +179,12 @@ def integrate_by_zone_and_layer(symbolic, state_elements, C, layers,
     integrated = integrate_by_zone(
         symbolic, state_elements, C, **state_element_types)
 
-    for (k, l) in product(integrated, layers):
-        y = symbolic[k][l]
-        integrated[k][l] = evaluate_symbolic_expression(
-            y, state_elements, C, **state_element_types)
+    keys = tuple(product(integrated, layers))
+    results = evaluate_symbolic_expressions(
+        [symbolic[k][l] for (k, l) in keys], state_elements, C,
+        **state_element_types)
+
+    for (k, l), result in zip(keys, results):
+        integrated[k][l] = result
 
     return integrated
@@ -8,3 +8,5 @@ UMZ_START = GRID.index(ZG) + 1
 LAYERS = tuple(range(len(GRID)))
 ZONE_LAYERS = ('EZ', 'UMZ') + LAYERS
 THICK = diff((0,) + GRID)
+LAYER_BOUNDS = tuple(zip((0,) + GRID[:-1], GRID))  # (top, bottom) per layer
+MID_DEPTHS = tuple((t + b) / 2 for (t, b) in LAYER_BOUNDS)
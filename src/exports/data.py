@@ -27,35 +27,19 @@ def process_poc_data(to_process):
         concentrations at each model grid depth, as well as the number of casts
         (i.e., samples) considered at each depth.
     """
+    by_depth = to_process.groupby('mod_depth')
+
     processed = pd.DataFrame(GRID, columns=['depth'])
-    processed['n_casts'] = [
-        get_number_of_casts(to_process, depth) for depth in GRID]
+    processed['n_casts'] = by_depth.size().reindex(GRID).values
+
+    aggregated = by_depth[['POCS', 'POCL']].agg(['mean', 'std']).reindex(GRID)
 
     for tracer in ('POCS', 'POCL'):
-        mean, sd = calculate_mean_and_sd(to_process, tracer)
+        mean = aggregated[(tracer, 'mean')].values
+        sd = aggregated[(tracer, 'std')].values
+        relative_sd_50m = sd[1] / mean[1]  # 50m is the second GRID depth
+        sd[0] = mean[0] * relative_sd_50m  # 30m is the first GRID depth
         processed[tracer] = mean
         processed[f'{tracer}_se'] = (sd / np.sqrt(processed['n_casts']))
 
     return processed
-
-
-def get_number_of_casts(to_process, depth):
-    """Get the number of casts considered at a given depth."""
-    n_casts = len(to_process[to_process['mod_depth'] == depth])
-
-    return n_casts
-
-
-def calculate_mean_and_sd(to_process, tracer):
-    """Calculate the mean and standard deviation at each depth."""
-    mean, sd = [], []
-
-    for depth in GRID:
-        at_depth = to_process[to_process['mod_depth'] == depth][tracer]
-        mean.append(at_depth.mean())
-        sd.append(at_depth.std())
-
-    relative_sd_50m = sd[1] / mean[1]  # 50m is the second GRID depth
-    sd[0] = mean[0] * relative_sd_50m  # 30m is the first GRID depth
-
-    return mean, sd
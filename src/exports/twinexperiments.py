@@ -3,7 +3,7 @@ import pickle
 
 from src.constants import DPY
 from src.unpack import slice_by_species
-from src.modelequations import evaluate_model_equations, get_layer_bounds
+from src.modelequations import compile_twin_model_equations
 from src.exports.constants import *
 
 
@@ -45,53 +45,42 @@ def generate_linear_solution(targets, n_tracer_elements):
     A = np.zeros((n_tracer_elements, n_tracer_elements))
     b = np.zeros(n_tracer_elements)
     element_index = targets['state_elements']
+    index_of = {e: i for i, e in enumerate(element_index)}
 
-    for i, element in enumerate(element_index[:n_tracer_elements]):
-
-        tracer, layer = element.split('_')
-        l = int(layer)
-        zi, zim1 = get_layer_bounds(l, GRID)
-        h = zi - zim1
-
-        iPsi = element_index.index(f'POCS_{l}')
-        iPli = element_index.index(f'POCL_{l}')
-
-        B2 = 0.8 / DPY  # from Murnane 1994, JGR
-        Bm2 = targets['params']['Bm2']['posterior'][l]
-        Bm1s = targets['params']['Bm1s']['posterior'][l]
-        Bm1l = targets['params']['Bm1l']['posterior'][l]
-        Po = targets['params']['Po']['posterior']
-        Lp = targets['params']['Lp']['posterior']
-        ws = targets['params']['ws']['posterior'][l]
-        wl = targets['params']['wl']['posterior'][l]
-
-        if l != 0:
-            iPsim1 = element_index.index(f'POCS_{l - 1}')
-            iPlim1 = element_index.index(f'POCL_{l - 1}')
-            wsm1 = targets['params']['ws']['posterior'][l - 1]
-            wlm1 = targets['params']['wl']['posterior'][l - 1]
-
-        if tracer == 'POCS':
-            if l == 0:
-                A[i, iPsi] = ws + (Bm1s + B2) * h
-                A[i, iPli] = -Bm2 * h
-                b[i] = Po * MLD
-            else:
-                A[i, iPsi] = ws + 0.5 * (Bm1s + B2) * h
-                A[i, iPsim1] = -wsm1 + 0.5 * (Bm1s + B2) * h
-                A[i, iPli] = -0.5 * Bm2 * h
-                A[i, iPlim1] = -0.5 * Bm2 * h
-                b[i] = Lp * Po * (np.exp(-(zim1 - MLD) / Lp)
-                                  - np.exp(-(zi - MLD) / Lp))
-        else:
-            if l == 0:
-                A[i, iPli] = wl + (Bm1l + Bm2) * h
-                A[i, iPsi] = -B2 * h
-            else:
-                A[i, iPli] = wl + 0.5 * (Bm1l + Bm2) * h
-                A[i, iPlim1] = -wlm1 + 0.5 * (Bm1l + Bm2) * h
-                A[i, iPsi] = -0.5 * B2 * h
-                A[i, iPsim1] = -0.5 * B2 * h
+    iPs = np.array([index_of[f'POCS_{l}'] for l in LAYERS])
+    iPl = np.array([index_of[f'POCL_{l}'] for l in LAYERS])
+
+    B2 = 0.8 / DPY  # from Murnane 1994, JGR
+    Bm2 = np.asarray(targets['params']['Bm2']['posterior'])
+    Bm1s = np.asarray(targets['params']['Bm1s']['posterior'])
+    Bm1l = np.asarray(targets['params']['Bm1l']['posterior'])
+    Po = targets['params']['Po']['posterior']
+    Lp = targets['params']['Lp']['posterior']
+    ws = np.asarray(targets['params']['ws']['posterior'])
+    wl = np.asarray(targets['params']['wl']['posterior'])
+
+    zi = np.asarray(GRID)
+    zim1 = np.concatenate(([0], zi[:-1]))
+    h = zi - zim1
+
+    # mixed layer equations
+    A[iPs[0], iPs[0]] = ws[0] + (Bm1s[0] + B2) * h[0]
+    A[iPs[0], iPl[0]] = -Bm2[0] * h[0]
+    A[iPl[0], iPl[0]] = wl[0] + (Bm1l[0] + Bm2[0]) * h[0]
+    A[iPl[0], iPs[0]] = -B2 * h[0]
+    b[iPs[0]] = Po * MLD
+
+    # subsurface equations, written along the (block) diagonals
+    A[iPs[1:], iPs[1:]] = ws[1:] + 0.5 * (Bm1s[1:] + B2) * h[1:]
+    A[iPs[1:], iPs[:-1]] = -ws[:-1] + 0.5 * (Bm1s[1:] + B2) * h[1:]
+    A[iPs[1:], iPl[1:]] = -0.5 * Bm2[1:] * h[1:]
+    A[iPs[1:], iPl[:-1]] = -0.5 * Bm2[1:] * h[1:]
+    A[iPl[1:], iPl[1:]] = wl[1:] + 0.5 * (Bm1l[1:] + Bm2[1:]) * h[1:]
+    A[iPl[1:], iPl[:-1]] = -wl[:-1] + 0.5 * (Bm1l[1:] + Bm2[1:]) * h[1:]
+    A[iPl[1:], iPs[1:]] = -0.5 * B2 * h[1:]
+    A[iPl[1:], iPs[:-1]] = -0.5 * B2 * h[1:]
+    b[iPs[1:]] = Lp * Po * (np.exp(-(zim1[1:] - MLD) / Lp)
+                            - np.exp(-(zi[1:] - MLD) / Lp))
 
     x = np.linalg.solve(A, b)
     x = np.clip(x, 10**-10, None)
@@ -121,23 +110,22 @@ def generate_nonlinear_solution(targets):
 
     Po = targets['params']['Po']['posterior']
     Lp = targets['params']['Lp']['posterior']
-    b = np.zeros(n_tracer_elements)
+    zi = np.asarray(GRID)
+    zim1 = np.concatenate(([0], zi[:-1]))
 
-    for layer in LAYERS:
-        l = int(layer)
-        zi, zim1 = get_layer_bounds(l, GRID)
-        if l == 0:
-            b[l] = -Po * MLD
-        else:
-            b[l] = -Lp * Po * (np.exp(-(zim1 - MLD) / Lp) -
-                               np.exp(-(zi - MLD) / Lp))
+    b = np.zeros(n_tracer_elements)
+    b[:len(GRID)] = -Lp * Po * (np.exp(-(zim1 - MLD) / Lp)
+                                - np.exp(-(zi - MLD) / Lp))
+    b[0] = -Po * MLD
 
     equation_elements = targets['equation_elements']
+    f_func, F_func = compile_twin_model_equations(
+        equation_elements, GRID, ZG, UMZ_START, MLD, targets,
+        soft_constraint=True)
 
     for _ in range(max_iterations):
-        f, F = evaluate_model_equations(
-            equation_elements, xk, GRID, ZG, UMZ_START, MLD, targets=targets,
-            soft_constraint=True)
+        f = np.squeeze(f_func(*xk))
+        F = F_func(*xk)
         xkp1 = np.linalg.solve(F, (F @ xk - f + b))
         change = np.abs((xkp1 - xk) / xk)
         if np.max(change) < max_change_limit:
@@ -1,13 +1,24 @@
 """Calculate POC fluxes."""
-import numpy as np
+from functools import lru_cache
+
 import sympy as sym
 
-from src.budgets import evaluate_symbolic_expression
+from src.budgets import evaluate_symbolic_expressions, get_symbol
 from src.modelequations import dvm_egestion, production, get_layer_bounds
 
 
 def get_symbolic_int_fluxes(umz_start, layers, thick, grid, zg, mld):
-    """Get symbolic expressions for fluxes integrated by model layer."""
+    """Get symbolic expressions for fluxes integrated by model layer.
+
+    The expressions depend only on the model configuration, so they are
+    built once per configuration and shared across runs.
+    """
+    return _get_symbolic_int_fluxes(umz_start, tuple(layers), tuple(thick),
+                                    tuple(grid), zg, mld)
+
+
+@lru_cache(maxsize=None)
+def _get_symbolic_int_fluxes(umz_start, layers, thick, grid, zg, mld):
     int_fluxes_sym = {}
 
     for size in ('S', 'L'):
@@ -30,8 +41,8 @@ def get_symbolic_int_fluxes(umz_start, layers, thick, grid, zg, mld):
 def profile_to_dict(profile, umz_start):
     """Create a dict (with model layers and zones as keys) from profile."""
     dictionary = {layer: value for layer, value in enumerate(profile)}
-    dictionary['EZ'] = np.sum(profile[:umz_start])
-    dictionary['UMZ'] = np.sum(profile[umz_start:])
+    dictionary['EZ'] = sym.Add(*profile[:umz_start])
+    dictionary['UMZ'] = sym.Add(*profile[umz_start:])
 
     return dictionary
 
@@ -134,17 +145,16 @@ def get_symbolic_dvm(umz_start, layers, thick, grid, zg):
 
 def sinking_fluxes(layers, state_elements, Ckp1, tracers, params):
     """Calculate sinking fluxes at all grid depths."""
-    sink_fluxes = {'S': [], 'L': [], 'T': []}
+    expressions = []
 
     for l in layers:
-        ws, ps, wl, pl = sym.symbols(f'ws_{l} POCS_{l} wl_{l} POCL_{l}')
-        sink_fluxes['S'].append(evaluate_symbolic_expression(
-            ws * ps, state_elements, Ckp1, tracers=tracers, params=params))
-        sink_fluxes['L'].append(evaluate_symbolic_expression(
-            wl * pl, state_elements, Ckp1, tracers=tracers, params=params))
-        sink_fluxes['T'].append(evaluate_symbolic_expression(
-            ws * ps + wl * pl, state_elements, Ckp1, tracers=tracers,
-            params=params))
+        ws, ps = get_symbol(f'ws_{l}'), get_symbol(f'POCS_{l}')
+        wl, pl = get_symbol(f'wl_{l}'), get_symbol(f'POCL_{l}')
+        expressions.extend((ws * ps, wl * pl, ws * ps + wl * pl))
+
+    results = evaluate_symbolic_expressions(
+        expressions, state_elements, Ckp1, tracers=tracers, params=params)
+    sink_fluxes = {'S': results[0::3], 'L': results[1::3], 'T': results[2::3]}
 
     return sink_fluxes
 
@@ -152,8 +162,8 @@ def sinking_fluxes(layers, state_elements, Ckp1, tracers, params):
 def production_profile(layers, state_elements, Ckp1, tracers, params, grid,
                        mld=None):
     """Calculate production profile. If mld, start decaying at base of ML."""
-    profile = []
-    Po, Lp = sym.symbols('Po Lp')
+    expressions = []
+    Po, Lp = get_symbol('Po'), get_symbol('Lp')
 
     for l in layers:
         z = grid[l]
@@ -161,7 +171,9 @@ def production_profile(layers, state_elements, Ckp1, tracers, params, grid,
             y = Po * sym.exp(-(z - mld) / Lp)
         else:
             y = Po * sym.exp(-(z) / Lp)
-        profile.append(evaluate_symbolic_expression(
-            y, state_elements, Ckp1, tracers=tracers, params=params))
+        expressions.append(y)
+
+    profile = evaluate_symbolic_expressions(
+        expressions, state_elements, Ckp1, tracers=tracers, params=params)
 
     return profile
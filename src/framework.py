@@ -46,45 +46,44 @@ def add_Th_elements(element_list, Th_fluxes):
             
 def define_prior_vector(tracers, params, layers, residuals=None, Th_fluxes=None):
     """Build the vector of prior state estimates."""
-    xo = []
-
-    for t in tracers:
-        xo.extend(tracers[t]['prior'])
+    blocks = [np.asarray(tracers[t]['prior'], dtype=float) for t in tracers]
 
     if residuals is not None:
         for r in residuals:
-            xo.extend(np.ones(len(layers)) * residuals[r]['prior'])
+            blocks.append(np.full(len(layers), residuals[r]['prior'],
+                                  dtype=float))
 
     for p in params:
         if params[p]['dv']:
-            xo.extend(np.ones(len(layers)) * params[p]['prior'])
+            blocks.append(np.full(len(layers), params[p]['prior'],
+                                  dtype=float))
         else:
-            xo.append(params[p]['prior'])
+            blocks.append(np.atleast_1d(float(params[p]['prior'])))
 
     if Th_fluxes is not None:
-        xo.extend(Th_fluxes['flux'].values)
+        blocks.append(Th_fluxes['flux'].values)
 
-    return np.array(xo)
+    return np.concatenate(blocks)
 
 
 def define_cov_matrix(tracers, params, layers, residuals=None, Th_fluxes=None):
     """Build the error covariance matrix of prior estimates."""
-    Co = []
-
-    for t in tracers:
-        Co.extend(tracers[t]['prior_e']**2)
+    blocks = [np.asarray(tracers[t]['prior_e'], dtype=float)**2
+              for t in tracers]
 
     if residuals is not None:
         for r in residuals:
-            Co.extend(np.ones(len(layers)) * residuals[r]['prior_e']**2)
+            blocks.append(np.full(len(layers), residuals[r]['prior_e']**2,
+                                  dtype=float))
 
     for p in params:
         if params[p]['dv']:
-            Co.extend(np.ones(len(layers)) * params[p]['prior_e']**2)
+            blocks.append(np.full(len(layers), params[p]['prior_e']**2,
+                                  dtype=float))
         else:
-            Co.append(params[p]['prior_e']**2)
+            blocks.append(np.atleast_1d(float(params[p]['prior_e'])**2))
 
     if Th_fluxes is not None:
-        Co.extend([f**2 for f in Th_fluxes['flux'].values])
+        blocks.append(Th_fluxes['flux'].values**2)
 
-    return np.diag(Co)
+    return np.diag(np.concatenate(blocks))
@@ -74,9 +74,8 @@ def poc_by_station():
     return data
 
 
-def clean_by_flags(raw):
-    
-    cleaned = raw.copy()
+def clean_by_flags(cleaned):
+
     flags_to_clean = (3, 4)
 
     tracers = ('POCS', 'POCL')
@@ -1,8 +1,10 @@
 """Construct and evaluate model equations."""
+from functools import lru_cache
+
 import numpy as np
 import sympy as sym
 
-from src.budgets import evaluate_symbolic_expression
+from src.budgets import evaluate_symbolic_expressions, get_symbol
 
 
 def evaluate_model_equations(equation_elements, xk, grid, zg, umz_start, mld,
@@ -29,23 +31,82 @@ def evaluate_model_equations(equation_elements, xk, grid, zg, umz_start, mld,
         f (np.ndarray): Vector of functions containing the model equations.
         F (np.ndarray): The Jacobian matrix.
     """
+    if targets is None:
+        f_func, F_func = compile_model_equations(
+            tuple(equation_elements), tuple(state_elements), tuple(grid), zg,
+            umz_start, mld, soft_constraint=soft_constraint)
+        f = np.squeeze(f_func(*xk))
+        F = F_func(*xk)
+        return f, F
+
+    f_func, F_func = compile_twin_model_equations(
+        equation_elements, grid, zg, umz_start, mld, targets,
+        soft_constraint=soft_constraint)
+    f = np.squeeze(f_func(*xk))
+    F = F_func(*xk)
+
+    return f, F
+
+
+def compile_twin_model_equations(equation_elements, grid, zg, umz_start, mld,
+                                 targets, soft_constraint=False):
+    """Build and compile the model equations for a twin experiment.
+
+    Known parameter and residual values are embedded as numbers, so the
+    system depends on the targets and can't share the cache used for
+    real-data inversions. Callers that iterate should compile once and
+    reuse the returned functions rather than re-lambdifying each step.
+
+    Returns:
+        f_func, F_func (callable): Functions that map a state vector to
+        numerical values of f and F, respectively.
+    """
     f_sym = []
-    if targets:
-        x_sym = [sym.symbols(v) for v  in equation_elements]
-    else:
-        x_sym = [sym.symbols(v) for v  in state_elements]
+    x_sym = [get_symbol(v) for v in equation_elements]
 
     for element in equation_elements:
         tracer, layer = element.split('_')
         y = equation_builder(tracer, int(layer), grid, zg, umz_start, mld,
                              targets=targets, soft_constraint=soft_constraint)
         f_sym.append(y)
-    
+
     f_sym = sym.Matrix(f_sym)
-    f = np.squeeze(sym.lambdify(x_sym, f_sym, 'numpy')(*xk))
-    F = sym.lambdify(x_sym, f_sym.jacobian(x_sym), 'numpy')(*xk)
+    f_func = sym.lambdify(x_sym, f_sym, 'numpy')
+    F_func = sym.lambdify(x_sym, f_sym.jacobian(x_sym), 'numpy')
 
-    return f, F
+    return f_func, F_func
+
+
+@lru_cache(maxsize=None)
+def compile_model_equations(equation_elements, state_elements, grid, zg,
+                            umz_start, mld, soft_constraint=False):
+    """Build and compile the model equations and their Jacobian.
+
+    The symbolic system depends only on the model configuration, not on the
+    state vector, so it is built, differentiated, and lambdified once and
+    reused across ATI iterations (and across inversions that share a
+    configuration). The Jacobian is formed with a single Matrix.jacobian
+    call, which reuses common subexpressions across entries, rather than
+    with per-element diff calls.
+
+    Returns:
+        f_func, F_func (callable): Functions that map a state vector to
+        numerical values of f and F, respectively.
+    """
+    f_sym = []
+    x_sym = [get_symbol(v) for v in state_elements]
+
+    for element in equation_elements:
+        tracer, layer = element.split('_')
+        y = equation_builder(tracer, int(layer), grid, zg, umz_start, mld,
+                             soft_constraint=soft_constraint)
+        f_sym.append(y)
+
+    f_sym = sym.Matrix(f_sym)
+    f_func = sym.lambdify(x_sym, f_sym, 'numpy')
+    F_func = sym.lambdify(x_sym, f_sym.jacobian(x_sym), 'numpy')
+
+    return f_func, F_func
 
 
 def equation_builder(tracer, layer, grid, zg, umz_start, mld, targets=None,
@@ -113,7 +174,7 @@ def equation_builder(tracer, layer, grid, zg, umz_start, mld, targets=None,
         if soft_constraint:
             eq += RPli
     else:
-        Th_flux = sym.symbols(f'Y_{layer}')
+        Th_flux = get_symbol(f'Y_{layer}')
         eq = (ws * Psi + wl * Pli) - Th_flux
 
     return eq
@@ -132,9 +193,19 @@ def production(layer, Po, Lp, zi, zim1, mld):
 
 
 def dvm_egestion(B3, a, zm, zg, zi, zim1, grid, umz_start):
-    """Build the DVM egestion term."""
+    """Build the DVM egestion term.
+
+    The same expression is rebuilt for every layer below the grazing zone
+    (and again when symbolic fluxes are assembled), so construction is
+    cached on the layer bounds and model configuration.
+    """
+    return _dvm_egestion(B3, a, zm, zg, zi, zim1, tuple(grid), umz_start)
+
+
+@lru_cache(maxsize=None)
+def _dvm_egestion(B3, a, zm, zg, zi, zim1, grid, umz_start):
     thick_EZ_layers = np.diff((0,) + grid[:umz_start])
-    Ps_syms = [sym.symbols(f'POCS_{l}') for l in list(range(umz_start))]
+    Ps_syms = [get_symbol(f'POCS_{l}') for l in list(range(umz_start))]
 
     Ps_avg = Ps_syms[0] * thick_EZ_layers[0]
     for i, thick in enumerate(thick_EZ_layers[1:]):
@@ -152,12 +223,12 @@ def dvm_egestion(B3, a, zm, zg, zi, zim1, grid, umz_start):
 def get_tracer_symbols(layer):
     """Get symbolic tracers for a given layer."""
     if layer == 0:
-        Psi = sym.symbols('POCS_0')
-        Pli = sym.symbols('POCL_0')
+        Psi = get_symbol('POCS_0')
+        Pli = get_symbol('POCL_0')
         return Psi, Pli
     else:
-        Psi, Psim1 = sym.symbols(f'POCS_{layer} POCS_{layer - 1}')
-        Pli, Plim1 = sym.symbols(f'POCL_{layer} POCL_{layer - 1}')
+        Psi, Psim1 = get_symbol(f'POCS_{layer}'), get_symbol(f'POCS_{layer - 1}')
+        Pli, Plim1 = get_symbol(f'POCL_{layer}'), get_symbol(f'POCL_{layer - 1}')
         Psa = (Psi + Psim1) / 2
         Pla = (Pli + Plim1) / 2
         return Psi, Pli, Psim1, Plim1, Psa, Pla
@@ -165,23 +236,23 @@ def get_tracer_symbols(layer):
 
 def get_param_symbols(layer):
     """Get symbolic model parameters for a given layer."""
-    Bm2 = sym.symbols(f'Bm2_{layer}')
-    B2p = sym.symbols(f'B2p_{layer}')
-    Bm1s = sym.symbols(f'Bm1s_{layer}')
-    Bm1l = sym.symbols(f'Bm1l_{layer}')
-    ws = sym.symbols(f'ws_{layer}')
-    wl = sym.symbols(f'wl_{layer}')
-    Po = sym.symbols('Po')
-    Lp = sym.symbols('Lp')
-    B3 = sym.symbols('B3')
-    a = sym.symbols('a')
-    zm = sym.symbols('zm')
+    Bm2 = get_symbol(f'Bm2_{layer}')
+    B2p = get_symbol(f'B2p_{layer}')
+    Bm1s = get_symbol(f'Bm1s_{layer}')
+    Bm1l = get_symbol(f'Bm1l_{layer}')
+    ws = get_symbol(f'ws_{layer}')
+    wl = get_symbol(f'wl_{layer}')
+    Po = get_symbol('Po')
+    Lp = get_symbol('Lp')
+    B3 = get_symbol('B3')
+    a = get_symbol('a')
+    zm = get_symbol('zm')
 
     params = [Bm2, B2p, Bm1s, Bm1l, ws, wl, Po, Lp, B3, a, zm]
 
     if layer != 0:
-        wsm1 = sym.symbols(f'ws_{layer - 1}')
-        wlm1 = sym.symbols(f'wl_{layer - 1}')
+        wsm1 = get_symbol(f'ws_{layer - 1}')
+        wlm1 = get_symbol(f'wl_{layer - 1}')
         params.extend([wsm1, wlm1])
 
     return params
@@ -189,8 +260,8 @@ def get_param_symbols(layer):
 
 def get_residual_symbols(layer):
     """Get symbolic residuals for a given layer."""
-    RPsi = sym.symbols(f'RPOCS_{layer}')
-    RPli = sym.symbols(f'RPOCL_{layer}')
+    RPsi = get_symbol(f'RPOCS_{layer}')
+    RPli = get_symbol(f'RPOCL_{layer}')
 
     return RPsi, RPli
 
@@ -237,18 +308,19 @@ def get_layer_bounds(layer, grid):
 
 def calculate_B2(grid, state_elements, Ckp1, tracers, params):
     """Calculate estimates of a first-order aggregation rate constant."""
-    params['B2'] = {'dv': True, 'posterior': [], 'posterior_e': []}
+    expressions = []
 
     for i in range(len(grid)):
-        B2p, Psi = sym.symbols(f'B2p_{i} POCS_{i}')
+        B2p, Psi = get_symbol(f'B2p_{i}'), get_symbol(f'POCS_{i}')
         if i == 0:
             Psa = Psi
         else:
-            Psim1 = sym.symbols(f'POCS_{i-1}')
+            Psim1 = get_symbol(f'POCS_{i-1}')
             Psa = (Psi + Psim1) / 2
-        y = B2p * Psa
-        estimate, error = evaluate_symbolic_expression(
-            y, state_elements, Ckp1, tracers=tracers, params=params)
+        expressions.append(B2p * Psa)
 
-        params['B2']['posterior'].append(estimate)
-        params['B2']['posterior_e'].append(error)
+    results = evaluate_symbolic_expressions(
+        expressions, state_elements, Ckp1, tracers=tracers, params=params)
+    params['B2'] = {'dv': True,
+                    'posterior': [est for (est, _) in results],
+                    'posterior_e': [err for (_, err) in results]}
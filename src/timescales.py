@@ -1,7 +1,16 @@
 """Calculate residence and turnover timescales."""
 from itertools import product
 
-from src.budgets import evaluate_symbolic_expression
+from src.budgets import evaluate_symbolic_expressions
+
+FLUXES_IN = {'POCS': ('production', 'disaggregation'),
+             'POCL': ('aggregation',)}
+
+FLUX_TRACERS = {'sinkdiv_S': ('POCS',), 'sinkdiv_L': ('POCL',),
+                'remin_S': ('POCS',), 'remin_L': ('POCL',),
+                'aggregation': ('POCS', 'POCL'),
+                'disaggregation': ('POCS', 'POCL'),
+                'production': ('POCS',), 'dvm': ('POCS', 'POCL')}
 
 
 def calculate_residence_times(inventories_sym, int_fluxes_sym, int_fluxes,
@@ -28,14 +37,20 @@ def calculate_residence_times(inventories_sym, int_fluxes_sym, int_fluxes,
     """
     res_times = {tracer: {} for tracer in inventories_sym}
 
-    for (tracer, z) in product(res_times, zone_layers):
+    keys = tuple(product(res_times, zone_layers))
+    ratios = []
+    for (tracer, z) in keys:
         inventory = inventories_sym[tracer][z]
         fluxes = sum_of_fluxes(
             tracer, z, int_fluxes_sym, int_fluxes, residuals_sym, residuals,
             umz_start)
-        res_times[tracer][z] = evaluate_symbolic_expression(
-            inventory / fluxes, state_elements, Ckp1, tracers=tracers,
-            residuals=residuals, params=params)
+        ratios.append(inventory / fluxes)
+
+    results = evaluate_symbolic_expressions(
+        ratios, state_elements, Ckp1, tracers=tracers, residuals=residuals,
+        params=params)
+    for (tracer, z), result in zip(keys, results):
+        res_times[tracer][z] = result
 
     return res_times
 
@@ -43,12 +58,10 @@ def calculate_residence_times(inventories_sym, int_fluxes_sym, int_fluxes,
 def sum_of_fluxes(tracer, z, int_fluxes_sym, int_fluxes, residuals_sym,
                   residuals, umz_start):
     """Get the (symbolic) sum of fluxes for a tracer in a zone or layer."""
-    fluxes_in = {'POCS': ['production', 'disaggregation'],
-                 'POCL': ['aggregation']}
     sum_of_fluxes = 0
     in_umz = (z == 'UMZ' or (isinstance(z, int) and z >= umz_start))
 
-    for f in fluxes_in[tracer]:
+    for f in FLUXES_IN[tracer]:
         sum_of_fluxes += int_fluxes_sym[f][z]
     if int_fluxes[f'sinkdiv_{tracer[-1]}'][z][0] < 0:
         sum_of_fluxes += -int_fluxes_sym[f'sinkdiv_{tracer[-1]}'][z]
@@ -64,20 +77,15 @@ def calculate_turnover_times(inventories_sym, int_fluxes_sym, int_fluxes,
                              tracers, params, state_elements, Ckp1,
                              zone_layers):
     """Calculate turnover times for tracers in all model layers and zones."""
-    flux_tracers = {'sinkdiv_S': ('POCS',), 'sinkdiv_L': ('POCL',),
-                    'remin_S': ('POCS',), 'remin_L': ('POCL',),
-                    'aggregation': ('POCS', 'POCL'),
-                    'disaggregation': ('POCS', 'POCL'),
-                    'production': ('POCS',), 'dvm': ('POCS', 'POCL')}
-
     turnover = {t: {z: {} for z in zone_layers} for t in tracers}
 
-    for (t, z, f) in product(tracers, zone_layers, int_fluxes):
-        if t in flux_tracers[f]:
-            inventory = inventories_sym[t][z]
-            flux = int_fluxes_sym[f][z]
-            turnover[t][z][f] = evaluate_symbolic_expression(
-                inventory / flux, state_elements, Ckp1, tracers=tracers,
-                params=params)
+    keys = [(t, z, f) for (t, z, f) in product(tracers, zone_layers, int_fluxes)
+            if t in FLUX_TRACERS[f]]
+    results = evaluate_symbolic_expressions(
+        [inventories_sym[t][z] / int_fluxes_sym[f][z] for (t, z, f) in keys],
+        state_elements, Ckp1, tracers=tracers, params=params)
+
+    for (t, z, f), result in zip(keys, results):
+        turnover[t][z][f] = result
 
     return turnover
@@ -1,4 +1,6 @@
 """Unpack the ATI solution into data containers."""
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -37,10 +39,20 @@ def unpack_state_estimates(tracers, params, state_elements, x, C, layers,
     return unpacked
 
 
+@lru_cache(maxsize=None)
+def species_indices(state_elements):
+    """Map each species to the indexes of its state elements."""
+    indices = {}
+    for i, e in enumerate(state_elements):
+        indices.setdefault(e.split('_')[0], []).append(i)
+
+    return indices
+
+
 def slice_by_species(to_slice, element, state_elements):
     """Get all values from a list that correspond to a given state element."""
-    sliced = [to_slice[i] for i, e in enumerate(
-        state_elements) if e.split('_')[0] == element]
+    indices = species_indices(tuple(state_elements))
+    sliced = [to_slice[i] for i in indices.get(element, ())]
 
     return sliced
 
@@ -92,7 +104,7 @@ def unpack_params(params, state_elements, x, x_e):
             param_estimates[p]['posterior_e'] = slice_by_species(
                 x_e, p, state_elements)
         else:
-            i = state_elements.index(p)
+            [i] = species_indices(tuple(state_elements))[p]
             param_estimates[p]['posterior'] = x[i]
             param_estimates[p]['posterior_e'] = x_e[i]
 